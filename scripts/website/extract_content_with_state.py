@@ -19,6 +19,16 @@ from state_manager import ArticleStateManager
 # 检查是否在GitHub Actions环境
 IS_GITHUB_ACTIONS = os.environ.get('GITHUB_ACTIONS') == 'true'
 
+# 预编译HTML解析用的正则表达式，避免每次调用时重复查找模式缓存
+TITLE_PATTERN = re.compile(r'<h1[^>]*class="rich_media_title"[^>]*>(.*?)</h1>', re.DOTALL)
+META_TITLE_PATTERN = re.compile(r'<meta\s+property="og:title"\s+content="([^"]+)"')
+AUTHOR_PATTERN = re.compile(r'<em[^>]*class="rich_media_meta[^>]*>([^<]+)</em>')
+DATE_PATTERN = re.compile(r'(\d{4}[-/]\d{1,2}[-/]\d{1,2})')
+CONTENT_PATTERN = re.compile(r'<div[^>]*class="rich_media_content"[^>]*>(.*?)</div>', re.DOTALL)
+TAG_PATTERN = re.compile(r'<[^>]+>')
+WHITESPACE_PATTERN = re.compile(r'\s+')
+IMG_SRC_PATTERN = re.compile(r'<img[^>]*src="([^"]+)"[^>]*>')
+
 
 def log(message: str, level: str = "INFO"):
     """统一的日志输出函数"""
@@ -40,42 +50,41 @@ def extract_from_html(html_content: str) -> Dict[str, Any]:
 
     # 提取标题
     title = ""
-    title_match = re.search(r'<h1[^>]*class="rich_media_title"[^>]*>(.*?)</h1>', html_content, re.DOTALL)
+    title_match = TITLE_PATTERN.search(html_content)
     if title_match:
         title = title_match.group(1).strip()
         log(f"找到标题: {title}")
     else:
         # 备用标题提取
-        meta_title_match = re.search(r'<meta\s+property="og:title"\s+content="([^"]+)"', html_content)
+        meta_title_match = META_TITLE_PATTERN.search(html_content)
         if meta_title_match:
             title = meta_title_match.group(1).strip()
 
     # 提取作者
     author = "瑞典马工"  # 默认值
-    author_match = re.search(r'<em[^>]*class="rich_media_meta[^>]*>([^<]+)</em>', html_content)
+    author_match = AUTHOR_PATTERN.search(html_content)
     if author_match:
         author = author_match.group(1).strip()
 
     # 提取发布日期
     publish_date = datetime.now().strftime("%Y-%m-%d")
-    date_match = re.search(r'(\d{4}[-/]\d{1,2}[-/]\d{1,2})', html_content)
+    date_match = DATE_PATTERN.search(html_content)
     if date_match:
         publish_date = date_match.group(1).replace('/', '-')
 
     # 提取正文内容
     content_text = ""
     content_html = ""
-    content_match = re.search(r'<div[^>]*class="rich_media_content"[^>]*>(.*?)</div>', html_content, re.DOTALL)
+    content_match = CONTENT_PATTERN.search(html_content)
     if content_match:
         content_html = content_match.group(1)
         # 简单清理HTML获取纯文本
-        content_text = re.sub(r'<[^>]+>', '', content_html)
-        content_text = re.sub(r'\s+', ' ', content_text).strip()
+        content_text = TAG_PATTERN.sub('', content_html)
+        content_text = WHITESPACE_PATTERN.sub(' ', content_text).strip()
 
     # 提取图片
     images = []
-    img_pattern = r'<img[^>]*src="([^"]+)"[^>]*>'
-    img_matches = re.findall(img_pattern, html_content)
+    img_matches = IMG_SRC_PATTERN.findall(html_content)
     for idx, img_url in enumerate(img_matches):
         images.append({
             "src": img_url,
@@ -217,8 +226,11 @@ def process_incremental(urls: List[str], state_manager: ArticleStateManager, for
         "results": []
     }
 
+    # 转为集合，避免在循环中对列表做线性查找（O(N·M) → O(N)）
+    pending_urls = set(urls_to_process)
+
     for url in urls:
-        if url not in urls_to_process and not force_update:
+        if url not in pending_urls and not force_update:
             # 检查是否需要更新
             article_state = state_manager.get_article_state(url)
             if article_state:
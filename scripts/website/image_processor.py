@@ -8,6 +8,7 @@ Responsible for downloading and optimizing images from WeChat articles
 """
 
 import os
+import glob
 import hashlib
 import logging
 from typing import Optional, Tuple, List
@@ -28,6 +29,10 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# 图片URL匹配模式
+IMG_SRC_PATTERN = re.compile(r'<img[^>]+src=["\']([^"\']+)["\']', re.IGNORECASE)
+IMG_DATA_SRC_PATTERN = re.compile(r'<img[^>]+data-src=["\']([^"\']+)["\']', re.IGNORECASE)
+
 
 class ImageProcessor:
     """图片处理器类"""
@@ -44,9 +49,13 @@ class ImageProcessor:
         self.max_width = int(os.getenv('MAX_IMAGE_WIDTH', 1200))
         self.max_height = int(os.getenv('MAX_IMAGE_HEIGHT', 800))
 
+        # 复用同一个HTTP会话，同一文章的多张图片共享连接池，避免重复TCP/TLS握手
+        self.session = requests.Session()
+        self.session.headers['User-Agent'] = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+
         # 创建下载目录
         os.makedirs(self.download_path, exist_ok=True)
-        logger.info(f"图片处理器初始化完成，下载路径: {self.download_path}")
+        logger.info("图片处理器初始化完成，下载路径: %s", self.download_path)
 
     def download_image(self, image_url: str, article_slug: str) -> Optional[str]:
         """
@@ -64,15 +73,20 @@ class ImageProcessor:
             article_dir = os.path.join(self.download_path, article_slug)
             os.makedirs(article_dir, exist_ok=True)
 
-            # 下载图片
-            response = requests.get(image_url, timeout=30, headers={
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-            })
-            response.raise_for_status()
-
             # 生成文件名（使用URL的MD5作为文件名避免重复）
             url_hash = hashlib.md5(image_url.encode()).hexdigest()[:8]
 
+            # 同一URL已下载过且文件完好则直接复用本地文件，跳过网络请求
+            cached_file = self._find_cached_image(article_dir, url_hash)
+            if cached_file:
+                relative_path = f"/images/{article_slug}/{os.path.basename(cached_file)}"
+                logger.info("图片已存在，跳过下载: %s -> %s", image_url, relative_path)
+                return relative_path
+
+            # 下载图片
+            response = self.session.get(image_url, timeout=30)
+            response.raise_for_status()
+
             # 尝试从URL获取原始文件扩展名
             parsed_url = urlparse(image_url)
             path = unquote(parsed_url.path)
@@ -81,27 +95,66 @@ class ImageProcessor:
             filename = f"{url_hash}{ext}"
             local_path = os.path.join(article_dir, filename)
 
-            # 处理并保存图片
-            processed_image = self._process_image(response.content)
-            if processed_image:
-                processed_image.save(local_path, quality=self.quality, optimize=True)
-
-                # 返回相对路径（用于前端访问）
-                relative_path = f"/images/{article_slug}/{filename}"
-                logger.info(f"成功下载并处理图片: {image_url} -> {relative_path}")
-                return relative_path
-            else:
-                # 如果处理失败，直接保存原图
-                with open(local_path, 'wb') as f:
-                    f.write(response.content)
-                relative_path = f"/images/{article_slug}/{filename}"
-                logger.warning(f"图片处理失败，保存原图: {relative_path}")
-                return relative_path
+            # 先写入同目录下的临时文件，完成后再原子替换，
+            # 避免中途中断留下的残缺文件被缓存命中。
+            # 以点开头的文件名不会匹配缓存查找的 {url_hash}.* 模式；
+            # 用普通 open 创建，文件权限遵循 umask，与直接写入时一致
+            tmp_path = os.path.join(article_dir, f".{url_hash}.{os.getpid()}.tmp{ext}")
+            try:
+                # 处理并保存图片
+                processed_image = self._process_image(response.content)
+                if processed_image:
+                    processed_image.save(tmp_path, quality=self.quality, optimize=True)
+                    os.replace(tmp_path, local_path)
+
+                    # 返回相对路径（用于前端访问）
+                    relative_path = f"/images/{article_slug}/{filename}"
+                    logger.info("成功下载并处理图片: %s -> %s", image_url, relative_path)
+                    return relative_path
+                else:
+                    # 如果处理失败，直接保存原图
+                    with open(tmp_path, 'wb') as f:
+                        f.write(response.content)
+                    os.replace(tmp_path, local_path)
+                    relative_path = f"/images/{article_slug}/{filename}"
+                    logger.warning("图片处理失败，保存原图: %s", relative_path)
+                    return relative_path
+            finally:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
 
         except Exception as e:
-            logger.error(f"下载图片失败 {image_url}: {str(e)}")
+            logger.error("下载图片失败 %s: %s", image_url, e)
             return None
 
+    def _find_cached_image(self, article_dir: str, url_hash: str) -> Optional[str]:
+        """
+        查找已下载的图片文件，并校验其完整性
+
+        Args:
+            article_dir: 文章图片目录
+            url_hash: 图片URL的哈希值
+
+        Returns:
+            可复用的本地文件路径，不存在或已损坏返回None
+        """
+        pattern = os.path.join(glob.escape(article_dir), f"{url_hash}.*")
+        for candidate in glob.glob(pattern):
+            try:
+                with Image.open(candidate) as img:
+                    img.verify()
+                # 刷新修改时间，避免 cleanup_old_images 按 mtime 删除仍在使用的图片
+                os.utime(candidate)
+                return candidate
+            except Exception:
+                # 残缺或损坏的文件（如旧版本中断写入留下的）删除后重新下载
+                logger.warning("缓存图片已损坏，重新下载: %s", candidate)
+                try:
+                    os.remove(candidate)
+                except OSError:
+                    pass
+        return None
+
     def _get_image_extension(self, content: bytes, url_path: str) -> str:
         """
         获取图片扩展名
@@ -165,12 +218,12 @@ class ImageProcessor:
                 new_width = int(width * ratio)
                 new_height = int(height * ratio)
                 img = img.resize((new_width, new_height), Image.Resampling.LANCZOS)
-                logger.debug(f"调整图片大小: {width}x{height} -> {new_width}x{new_height}")
+                logger.debug("调整图片大小: %dx%d -> %dx%d", width, height, new_width, new_height)
 
             return img
 
         except Exception as e:
-            logger.error(f"处理图片失败: {str(e)}")
+            logger.error("处理图片失败: %s", e)
             return None
 
     def process_article_images(self, html_content: str, article_slug: str) -> Tuple[str, List[dict]]:
@@ -185,14 +238,13 @@ class ImageProcessor:
             (处理后的HTML内容, 图片映射列表)
         """
         # 查找所有图片URL
-        img_pattern = re.compile(r'<img[^>]+src=["\']([^"\']+)["\']', re.IGNORECASE)
-        img_urls = img_pattern.findall(html_content)
+        img_urls = IMG_SRC_PATTERN.findall(html_content)
 
         # 也查找data-src属性（微信懒加载）
-        data_src_pattern = re.compile(r'<img[^>]+data-src=["\']([^"\']+)["\']', re.IGNORECASE)
-        data_src_urls = data_src_pattern.findall(html_content)
+        data_src_urls = IMG_DATA_SRC_PATTERN.findall(html_content)
 
-        all_urls = list(set(img_urls + data_src_urls))
+        # 去重并保持出现顺序，保证下载和替换顺序稳定
+        all_urls = list(dict.fromkeys(img_urls + data_src_urls))
 
         image_mapping = []
         updated_html = html_content
@@ -211,7 +263,7 @@ class ImageProcessor:
                     'local_path': local_path
                 })
 
-        logger.info(f"处理完成 {len(image_mapping)} 张图片")
+        logger.info("处理完成 %d 张图片", len(image_mapping))
         return updated_html, image_mapping
 
     def cleanup_old_images(self, days: int = 30):
@@ -232,9 +284,9 @@ class ImageProcessor:
                 if os.path.getmtime(file_path) < cutoff_time:
                     try:
                         os.remove(file_path)
-                        logger.info(f"删除旧图片: {file_path}")
+                        logger.info("删除旧图片: %s", file_path)
                     except Exception as e:
-                        logger.error(f"删除图片失败 {file_path}: {str(e)}")
+                        logger.error("删除图片失败 %s: %s", file_path, e)
 
 
 def main():
@@ -14,6 +14,44 @@ import yaml
 from urllib.parse import urlparse
 
 
+# 关键词 -> 标签映射（模块级常量，避免每次调用重建）
+TAG_KEYWORDS = {
+    '瑞典': ['瑞典', 'Sweden'],
+    '斯德哥尔摩': ['斯德哥尔摩', 'Stockholm', '瑞典首都'],
+    '生活': ['生活', 'Life'],
+    '工作': ['工作', 'Work', '职场'],
+    '教育': ['教育', 'Education'],
+    '医疗': ['医疗', 'Healthcare', '健康'],
+    '科技': ['科技', 'Technology', '技术'],
+    '创业': ['创业', 'Startup', '创新'],
+    '文化': ['文化', 'Culture'],
+    '旅游': ['旅游', 'Travel', '旅行'],
+    '美食': ['美食', 'Food', '饮食'],
+    '房产': ['房产', 'Real Estate', '房地产'],
+    '移民': ['移民', 'Immigration', '移居'],
+    '语言': ['语言', 'Language', '瑞典语'],
+    '福利': ['福利', 'Welfare', '社会保障']
+}
+
+# 类别 -> 关键词映射
+CATEGORY_KEYWORDS = {
+    '生活': ['生活', '日常', '居住', '超市', '购物'],
+    '工作': ['工作', '职场', '求职', '面试', '公司'],
+    '教育': ['教育', '学校', '大学', '学习', '孩子'],
+    '科技': ['科技', '技术', '创业', '互联网', 'IT'],
+    '文化': ['文化', '节日', '传统', '习俗', '艺术'],
+    '旅游': ['旅游', '景点', '游玩', '度假', '风景'],
+    '美食': ['美食', '餐厅', '烹饪', '食物', '饮食'],
+    '其他': []
+}
+
+# slug 及正文清理用的正则（预编译）
+SLUG_INVALID_CHARS_PATTERN = re.compile(r'[^\w\s\u4e00-\u9fff-]')
+WHITESPACE_PATTERN = re.compile(r'\s+')
+REPEATED_HYPHEN_PATTERN = re.compile(r'-+')
+EXTRA_BLANK_LINES_PATTERN = re.compile(r'\n{3,}')
+
+
 def log(message: str, level: str = "INFO"):
     """统一的日志输出函数"""
     timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
@@ -31,11 +69,11 @@ def sanitize_slug(title: str) -> str:
         URL友好的slug字符串
     """
     # 移除特殊字符，保留字母、数字、空格和中文
-    slug = re.sub(r'[^\w\s\u4e00-\u9fff-]', '', title.lower())
+    slug = SLUG_INVALID_CHARS_PATTERN.sub('', title.lower())
     # 将空格替换为连字符
-    slug = re.sub(r'\s+', '-', slug.strip())
+    slug = WHITESPACE_PATTERN.sub('-', slug.strip())
     # 移除连续的连字符
-    slug = re.sub(r'-+', '-', slug)
+    slug = REPEATED_HYPHEN_PATTERN.sub('-', slug)
     # 限制长度
     if len(slug) > 50:
         slug = slug[:50].rsplit('-', 1)[0]
@@ -60,29 +98,10 @@ def generate_tags(content: str, title: str = "") -> List[str]:
     """
     tags = []
 
-    # 定义关键词映射
-    keyword_tags = {
-        '瑞典': ['瑞典', 'Sweden'],
-        '斯德哥尔摩': ['斯德哥尔摩', 'Stockholm', '瑞典首都'],
-        '生活': ['生活', 'Life'],
-        '工作': ['工作', 'Work', '职场'],
-        '教育': ['教育', 'Education'],
-        '医疗': ['医疗', 'Healthcare', '健康'],
-        '科技': ['科技', 'Technology', '技术'],
-        '创业': ['创业', 'Startup', '创新'],
-        '文化': ['文化', 'Culture'],
-        '旅游': ['旅游', 'Travel', '旅行'],
-        '美食': ['美食', 'Food', '饮食'],
-        '房产': ['房产', 'Real Estate', '房地产'],
-        '移民': ['移民', 'Immigration', '移居'],
-        '语言': ['语言', 'Language', '瑞典语'],
-        '福利': ['福利', 'Welfare', '社会保障']
-    }
-
     # 检查内容和标题中的关键词
     combined_text = (title + " " + content).lower()
 
-    for keyword, tag_list in keyword_tags.items():
+    for keyword, tag_list in TAG_KEYWORDS.items():
         if keyword.lower() in combined_text:
             tags.extend(tag_list[:2])  # 只取前两个相关标签
 
@@ -107,23 +126,11 @@ def determine_category(title: str, content: str) -> str:
     Returns:
         类别名称
     """
-    # 定义类别关键词
-    categories = {
-        '生活': ['生活', '日常', '居住', '超市', '购物'],
-        '工作': ['工作', '职场', '求职', '面试', '公司'],
-        '教育': ['教育', '学校', '大学', '学习', '孩子'],
-        '科技': ['科技', '技术', '创业', '互联网', 'IT'],
-        '文化': ['文化', '节日', '传统', '习俗', '艺术'],
-        '旅游': ['旅游', '景点', '游玩', '度假', '风景'],
-        '美食': ['美食', '餐厅', '烹饪', '食物', '饮食'],
-        '其他': []
-    }
-
     combined_text = (title + " " + content[:500]).lower()
 
     # 统计每个类别的匹配次数
     category_scores = {}
-    for category, keywords in categories.items():
+    for category, keywords in CATEGORY_KEYWORDS.items():
         if category == '其他':
             continue
         score = sum(1 for keyword in keywords if keyword in combined_text)
@@ -190,7 +197,7 @@ def format_content_to_markdown(content: Dict[str, Any], images: List[Dict[str, A
 
     # 清理文本
     # 移除多余的空行
-    text = re.sub(r'\n{3,}', '\n\n', text)
+    text = EXTRA_BLANK_LINES_PATTERN.sub('\n\n', text)
 
     # 确保段落之间有空行
     paragraphs = text.split('\n\n')
@@ -8,6 +8,7 @@
 import json
 import os
 import hashlib
+from collections import Counter
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional, Any
@@ -164,6 +165,9 @@ class ArticleStateManager:
             content = article_data.get("content", {}).get("text", "")
             content_hash = self._calculate_content_hash(content)
 
+            # 同一次处理只取一次时间戳
+            now = datetime.now().isoformat()
+
             # 构建文章状态记录
             article_state = {
                 "url": url,
@@ -173,8 +177,8 @@ class ArticleStateManager:
                 "content_hash": content_hash,
                 "word_count": article_data.get("word_count", 0),
                 "image_count": len(article_data.get("images", [])),
-                "first_processed_at": datetime.now().isoformat(),
-                "last_processed_at": datetime.now().isoformat(),
+                "first_processed_at": now,
+                "last_processed_at": now,
                 "process_count": 1,
                 "status": "completed",
                 "error": None
@@ -216,19 +220,21 @@ class ArticleStateManager:
             if "articles" not in self.state_data:
                 self.state_data["articles"] = {}
 
+            now = datetime.now().isoformat()
+
             # 如果文章已存在，更新错误状态
             if url in self.state_data["articles"]:
                 self.state_data["articles"][url]["status"] = "error"
                 self.state_data["articles"][url]["error"] = error_message
-                self.state_data["articles"][url]["last_processed_at"] = datetime.now().isoformat()
+                self.state_data["articles"][url]["last_processed_at"] = now
             else:
                 # 创建新的错误记录
                 self.state_data["articles"][url] = {
                     "url": url,
                     "status": "error",
                     "error": error_message,
-                    "first_processed_at": datetime.now().isoformat(),
-                    "last_processed_at": datetime.now().isoformat(),
+                    "first_processed_at": now,
+                    "last_processed_at": now,
                     "process_count": 1
                 }
 
@@ -284,9 +290,10 @@ class ArticleStateManager:
 
         # 添加更多统计信息
         articles = self.state_data.get("articles", {})
+        status_counts = Counter(a.get("status") for a in articles.values())
         stats["total_articles"] = len(articles)
-        stats["successful_articles"] = len([a for a in articles.values() if a.get("status") == "completed"])
-        stats["error_articles"] = len([a for a in articles.values() if a.get("status") == "error"])
+        stats["successful_articles"] = status_counts["completed"]
+        stats["error_articles"] = status_counts["error"]
 
         return stats
 
@@ -348,11 +355,15 @@ class ArticleStateManager:
                 except ValueError:
                     continue
 
+        if not urls_to_remove:
+            return 0
+
+        # 先批量删除，再统一保存一次，避免每删一条就重写整个状态文件
         for url in urls_to_remove:
-            if self.remove_article(url):
-                removed_count += 1
+            del articles[url]
+            removed_count += 1
 
-        return removed_count
+        return removed_count if self._save_state() else 0
 
 
 def main():
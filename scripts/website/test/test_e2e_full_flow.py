@@ -448,9 +448,9 @@ Although finding housing is not easy, Stockholm's quality of life is high and wo
 
         print(f"测试大型文章 (约{len(large_html)}字符)...")
 
-        start_time = time.time()
+        start_time = time.perf_counter()
         result = self.extract_article_content(large_html)
-        extraction_time = time.time() - start_time
+        extraction_time = time.perf_counter() - start_time
 
         print(f"  提取时间: {extraction_time:.2f}秒")
 
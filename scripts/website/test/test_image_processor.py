@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+图片处理器的单元测试
+"""
+
+import unittest
+from unittest.mock import patch, MagicMock
+import sys
+import os
+import shutil
+import stat
+import tempfile
+import time
+from io import BytesIO
+
+from PIL import Image
+
+# 添加父目录到系统路径
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from image_processor import ImageProcessor
+
+
+def make_png_bytes(size=(40, 30)) -> bytes:
+    """生成一张测试用PNG图片"""
+    buffer = BytesIO()
+    Image.new('RGB', size, (200, 100, 50)).save(buffer, format='PNG')
+    return buffer.getvalue()
+
+
+class TestImageProcessorCache(unittest.TestCase):
+    """图片下载缓存测试类"""
+
+    def setUp(self):
+        # 目录名包含glob特殊字符，验证路径已正确转义
+        self.temp_dir = tempfile.mkdtemp(prefix='images[cache]-')
+        self.processor = ImageProcessor(download_path=self.temp_dir)
+
+        self.response = MagicMock()
+        self.response.content = make_png_bytes()
+        self.response.raise_for_status = MagicMock()
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_second_download_reuses_cached_file(self):
+        """测试同一URL第二次下载时复用本地文件，不再发起HTTP请求"""
+        url = 'https://example.com/photo.png'
+
+        with patch.object(self.processor.session, 'get', return_value=self.response) as mock_get:
+            first = self.processor.download_image(url, 'article')
+            second = self.processor.download_image(url, 'article')
+
+        self.assertIsNotNone(first)
+        self.assertEqual(first, second)
+        self.assertEqual(mock_get.call_count, 1)
+
+        # 只留下最终文件，没有残留的临时文件
+        article_dir = os.path.join(self.temp_dir, 'article')
+        self.assertEqual(os.listdir(article_dir), [os.path.basename(first)])
+
+        # 文件权限遵循 umask，与直接写入时一致（不能是临时文件的 0600）
+        umask = os.umask(0)
+        os.umask(umask)
+        local_file = os.path.join(article_dir, os.path.basename(first))
+        self.assertEqual(stat.S_IMODE(os.stat(local_file).st_mode), 0o666 & ~umask)
+
+    def test_cache_hit_refreshes_mtime(self):
+        """测试命中缓存时刷新文件修改时间，避免被 cleanup_old_images 误删"""
+        url = 'https://example.com/photo.png'
+
+        with patch.object(self.processor.session, 'get', return_value=self.response):
+            first = self.processor.download_image(url, 'article')
+
+            # 模拟很久以前下载的图片
+            local_file = os.path.join(self.temp_dir, 'article', os.path.basename(first))
+            old_time = time.time() - 60 * 24 * 60 * 60
+            os.utime(local_file, (old_time, old_time))
+
+            second = self.processor.download_image(url, 'article')
+
+        self.assertEqual(first, second)
+        self.processor.cleanup_old_images(days=30)
+        self.assertTrue(os.path.exists(local_file))
+
+    def test_corrupted_cached_file_is_redownloaded(self):
+        """测试残缺的缓存文件会被丢弃并重新下载"""
+        url = 'https://example.com/photo.png'
+
+        with patch.object(self.processor.session, 'get', return_value=self.response) as mock_get:
+            first = self.processor.download_image(url, 'article')
+
+            # 模拟中断写入留下的残缺文件
+            local_file = os.path.join(self.temp_dir, 'article', os.path.basename(first))
+            with open(local_file, 'wb') as f:
+                f.write(self.response.content[:10])
+
+            second = self.processor.download_image(url, 'article')
+
+        self.assertEqual(first, second)
+        self.assertEqual(mock_get.call_count, 2)
+        with Image.open(local_file) as img:
+            img.verify()
+
+
+if __name__ == '__main__':
+    unittest.main()
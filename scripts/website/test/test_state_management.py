@@ -284,6 +284,11 @@ def test_cleanup_old_entries():
         # 验证旧条目被删除，新条目保留
         assert not manager.is_article_processed("https://old.com/1"), "旧条目未被删除"
         assert manager.is_article_processed("https://recent.com/1"), "近期条目被误删"
+
+        # 重新加载，验证清理结果已写入状态文件
+        reloaded = ArticleStateManager(temp_path)
+        assert not reloaded.is_article_processed("https://old.com/1"), "清理结果未持久化"
+        assert reloaded.is_article_processed("https://recent.com/1"), "近期条目未持久化"
         print("✓ 清理旧条目成功")
 
     finally:
@@ -8,6 +8,7 @@ from unittest.mock import patch, MagicMock, mock_open
 import sys
 import os
 import json
+import time
 from pathlib import Path
 
 # 添加父目录到系统路径
@@ -153,6 +154,46 @@ class TestWeChatExtractor(unittest.TestCase):
 
         self.assertIsNone(result)
 
+    @patch('wechat_extractor.download_image')
+    def test_extract_from_html_concurrent_downloads_keep_order(self, mock_download):
+        """测试并发下载图片后，本地路径与图片一一对应"""
+        html = '''
+        <html>
+            <body>
+                <div id="js_content">
+                    <img data-src="https://example.com/a.jpg">
+                    <img data-src="https://example.com/b.jpg">
+                    <img data-src="https://example.com/fail.jpg">
+                    <img data-src="https://example.com/d.jpg">
+                </div>
+            </body>
+        </html>
+        '''
+
+        # 让靠前的图片更晚完成，打乱完成顺序
+        delays = {'a.jpg': 0.05, 'b.jpg': 0.03}
+
+        def fake_download(url, save_dir, filename):
+            name = url.rsplit('/', 1)[-1]
+            time.sleep(delays.get(name, 0))
+            if name == 'fail.jpg':
+                return None
+            return f"{save_dir}/{name}"
+
+        mock_download.side_effect = fake_download
+
+        result = extract_from_html(html, save_images=True, image_dir=Path('/tmp/test_images'))
+        images = result['images']
+
+        self.assertEqual(len(images), 4)
+        self.assertEqual(mock_download.call_count, 4)
+        for image in images:
+            if 'fail' in image['src']:
+                self.assertIsNone(image['local_path'])
+            else:
+                expected = f"/tmp/test_images/{image['src'].rsplit('/', 1)[-1]}"
+                self.assertEqual(image['local_path'], expected)
+
     @patch('wechat_extractor.requests.get')
     def test_extract_from_url_success(self, mock_get):
         """测试从URL成功提取"""
@@ -15,6 +15,14 @@ import argparse
 from pathlib import Path
 from typing import Dict, List, Tuple, Any
 
+# 预编译验证用的正则表达式，批量验证时只编译一次
+DATE_PATTERN = re.compile(r'^\d{4}-\d{2}-\d{2}$')
+SLUG_PATTERN = re.compile(r'^[a-z0-9]+(?:-[a-z0-9]+)*$')
+MAIN_TITLE_PATTERN = re.compile(r'^# .+', re.MULTILINE)
+IMAGE_REF_PATTERN = re.compile(r'!\[([^\]]*)\]\(([^)]+)\)')
+LINK_REF_PATTERN = re.compile(r'(?<!!)\[([^\]]+)\]\(([^)]+)\)')
+SUPPORTED_IMAGE_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.webp')
+
 def validate_yaml_frontmatter(content: str) -> Tuple[bool, Dict, List[str]]:
     """验证YAML frontmatter格式和必需字段"""
     errors = []
@@ -54,8 +62,7 @@ def validate_yaml_frontmatter(content: str) -> Tuple[bool, Dict, List[str]]:
     
     # 验证日期格式
     if 'date' in frontmatter_data:
-        date_pattern = r'^\d{4}-\d{2}-\d{2}$'
-        if not re.match(date_pattern, str(frontmatter_data['date'])):
+        if not DATE_PATTERN.match(str(frontmatter_data['date'])):
             errors.append(f"日期格式错误，应为 YYYY-MM-DD: {frontmatter_data['date']}")
     
     # 验证tags格式
@@ -71,8 +78,7 @@ def validate_yaml_frontmatter(content: str) -> Tuple[bool, Dict, List[str]]:
     # 验证slug格式
     if 'slug' in frontmatter_data:
         slug = frontmatter_data['slug']
-        slug_pattern = r'^[a-z0-9]+(?:-[a-z0-9]+)*$'
-        if not re.match(slug_pattern, slug):
+        if not SLUG_PATTERN.match(slug):
             errors.append(f"slug格式错误，应只包含小写字母、数字和连字符: {slug}")
     
     return len(errors) == 0, frontmatter_data, errors
@@ -88,11 +94,11 @@ def validate_markdown_content(content: str, frontmatter_end: int) -> Tuple[bool,
         errors.append("Markdown内容太短，至少需要50个字符")
     
     # 检查是否有主标题
-    if not re.search(r'^# .+', markdown_content, re.MULTILINE):
+    if not MAIN_TITLE_PATTERN.search(markdown_content):
         errors.append("缺少主标题（# 格式）")
     
     # 检查图片引用格式
-    image_refs = re.findall(r'!\[([^\]]*)\]\(([^)]+)\)', markdown_content)
+    image_refs = IMAGE_REF_PATTERN.findall(markdown_content)
     for alt_text, img_path in image_refs:
         # 检查本地图片路径
         if not img_path.startswith(('http://', 'https://')):
@@ -100,11 +106,11 @@ def validate_markdown_content(content: str, frontmatter_end: int) -> Tuple[bool,
                 errors.append(f"本地图片路径应以 'images/' 开头: {img_path}")
             
             # 检查图片文件扩展名
-            if not re.search(r'\.(jpg|jpeg|png|webp)$', img_path.lower()):
+            if not img_path.lower().endswith(SUPPORTED_IMAGE_EXTENSIONS):
                 errors.append(f"不支持的图片格式: {img_path}")
     
     # 检查链接格式
-    link_refs = re.findall(r'(?<!!)\[([^\]]+)\]\(([^)]+)\)', markdown_content)
+    link_refs = LINK_REF_PATTERN.findall(markdown_content)
     for link_text, link_url in link_refs:
         if link_url.startswith('http'):
             continue  # 外部链接，跳过
@@ -14,11 +14,33 @@ from typing import Dict, List, Any, Optional
 import requests
 from bs4 import BeautifulSoup
 from urllib.parse import urljoin, urlparse
+from concurrent.futures import ThreadPoolExecutor
 import time
 
 # 检查是否在GitHub Actions环境
 IS_GITHUB_ACTIONS = os.environ.get('GITHUB_ACTIONS') == 'true'
 
+# 预编译正则表达式，避免每次调用时重复查找模式缓存
+WHITESPACE_PATTERN = re.compile(r'\s+')
+CN_DATE_PATTERN = re.compile(r'(\d{4})年(\d{1,2})月(\d{1,2})日')
+ISO_DATE_PATTERN = re.compile(r'(\d{4})-(\d{1,2})-(\d{1,2})')
+PUBLISH_TIME_VAR_PATTERN = re.compile(r'var\s+publish_time\s*=\s*"([^"]+)"')
+
+# 图片并发下载的最大线程数
+MAX_DOWNLOAD_WORKERS = 4
+
+# content-type 关键字 -> 文件扩展名（按顺序匹配）
+CONTENT_TYPE_EXTENSIONS = (
+    ('jpeg', '.jpg'),
+    ('jpg', '.jpg'),
+    ('png', '.png'),
+    ('gif', '.gif'),
+    ('webp', '.webp'),
+)
+
+# URL 中可直接采用的图片扩展名
+IMAGE_EXTENSIONS = frozenset({'.jpg', '.jpeg', '.png', '.gif', '.webp'})
+
 def log(message: str, level: str = "INFO"):
     """统一的日志输出函数"""
     timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
@@ -29,7 +51,7 @@ def clean_text(text: str) -> str:
     if not text:
         return ""
     # 去除多余的空白字符
-    text = re.sub(r'\s+', ' ', text)
+    text = WHITESPACE_PATTERN.sub(' ', text)
     # 去除首尾空白
     text = text.strip()
     return text
@@ -62,19 +84,15 @@ def download_image(url: str, save_dir: Path, filename: str) -> Optional[str]:
 
         # 确定文件扩展名
         content_type = response.headers.get('content-type', '')
-        if 'jpeg' in content_type or 'jpg' in content_type:
-            ext = '.jpg'
-        elif 'png' in content_type:
-            ext = '.png'
-        elif 'gif' in content_type:
-            ext = '.gif'
-        elif 'webp' in content_type:
-            ext = '.webp'
-        else:
+        ext = next(
+            (suffix for marker, suffix in CONTENT_TYPE_EXTENSIONS if marker in content_type),
+            None
+        )
+        if ext is None:
             # 尝试从URL中获取扩展名
             parsed_url = urlparse(url)
             path_ext = Path(parsed_url.path).suffix
-            ext = path_ext if path_ext in ['.jpg', '.jpeg', '.png', '.gif', '.webp'] else '.jpg'
+            ext = path_ext if path_ext in IMAGE_EXTENSIONS else '.jpg'
 
         # 确保文件名有正确的扩展名
         if not filename.endswith(ext):
@@ -154,7 +172,8 @@ def extract_from_html(html_content: str, save_images: bool = True, image_dir: Pa
             log(f"从meta标签找到作者: {author}")
 
     # 3. 提取发布日期
-    publish_date = datetime.now().strftime("%Y-%m-%d")  # 默认今天
+    today = datetime.now().strftime("%Y-%m-%d")
+    publish_date = today  # 默认今天
 
     # 查找发布时间
     publish_time_elem = soup.find('em', id='publish_time')
@@ -165,13 +184,13 @@ def extract_from_html(html_content: str, save_images: bool = True, image_dir: Pa
             # 处理不同的日期格式
             if '年' in date_text and '月' in date_text and '日' in date_text:
                 # 中文日期格式：2024年1月15日
-                date_match = re.search(r'(\d{4})年(\d{1,2})月(\d{1,2})日', date_text)
+                date_match = CN_DATE_PATTERN.search(date_text)
                 if date_match:
                     year, month, day = date_match.groups()
                     publish_date = f"{year}-{month:0>2}-{day:0>2}"
             else:
                 # 尝试标准格式
-                date_match = re.search(r'(\d{4})-(\d{1,2})-(\d{1,2})', date_text)
+                date_match = ISO_DATE_PATTERN.search(date_text)
                 if date_match:
                     publish_date = date_match.group(0)
             log(f"找到发布日期: {publish_date}")
@@ -179,8 +198,8 @@ def extract_from_html(html_content: str, save_images: bool = True, image_dir: Pa
             log(f"解析日期失败: {e}", "WARNING")
 
     # 从JavaScript变量中提取日期
-    if publish_date == datetime.now().strftime("%Y-%m-%d"):
-        script_match = re.search(r'var\s+publish_time\s*=\s*"([^"]+)"', html_content)
+    if publish_date == today:
+        script_match = PUBLISH_TIME_VAR_PATTERN.search(html_content)
         if script_match:
             date_text = script_match.group(1)
             try:
@@ -264,21 +283,24 @@ def extract_from_html(html_content: str, save_images: bool = True, image_dir: Pa
             # 生成本地文件名
             local_filename = f"image_{idx+1:03d}"
 
-            image_info = {
+            images.append({
                 "src": img_url,
                 "alt": alt_text,
                 "local_filename": local_filename,
                 "local_path": None
-            }
-
-            # 下载图片
-            if save_images and image_dir:
-                local_path = download_image(img_url, image_dir, local_filename)
+            })
+
+    # 下载图片：各图片互不依赖，并发下载以减少网络等待
+    if save_images and image_dir and images:
+        with ThreadPoolExecutor(max_workers=MAX_DOWNLOAD_WORKERS) as executor:
+            local_paths = executor.map(
+                lambda info: download_image(info["src"], image_dir, info["local_filename"]),
+                images
+            )
+            for image_info, local_path in zip(images, local_paths):
                 if local_path:
                     image_info["local_path"] = local_path
 
-            images.append(image_info)
-
     log(f"找到 {len(images)} 张图片")
 
     # 构建返回数据
@@ -13,23 +13,30 @@ import re
 DAILY_DIR = Path("/Users/Shared/code/benyu/daily_messages")
 OUTPUT_FILE = Path("/Users/Shared/code/benyu/daily_analysis_batches.txt")
 
+# Common technical terms and topics (case insensitive English)
+TECH_TERMS = [
+    'AI', 'LLM', 'GPT', 'Claude', 'ChatGPT', 'API',
+    'token', 'FDE', 'Palantir', 'OpenAI',
+    'kubernetes', 'Docker', 'CD', 'pipeline',
+    'frontend', 'backend', 'database', 'db',
+]
+
+# One alternation wrapped in a lookahead so overlapping terms (e.g. GPT inside
+# ChatGPT, AI inside OpenAI) are all still reported
+TECH_TERMS_PATTERN = re.compile(
+    '(?=(' + '|'.join(map(re.escape, TECH_TERMS)) + '))', re.IGNORECASE
+)
+
 def extract_keywords(text):
     """Extract potential keywords from Chinese text"""
     # Remove common patterns and extract meaningful words
     # This is a simple approach - for better results, use jieba or similar
-    keywords = []
-
-    # Common technical terms and topics (case insensitive English)
-    tech_patterns = [
-        r'AI', r'LLM', r'GPT', r'Claude', r'ChatGPT', r'API',
-        r'token', r'FDE', r'Palantir', r'OpenAI',
-        r'kubernetes', r'Docker', r'CD', r'pipeline',
-        r'frontend', r'backend', r'database', r'db',
-    ]
-
-    for pattern in tech_patterns:
-        if re.search(pattern, text, re.IGNORECASE):
-            keywords.append(pattern.lower())
+
+    # Single scan: every term found anywhere in the text, lowercased
+    found = {match.lower() for match in TECH_TERMS_PATTERN.findall(text)}
+
+    # Report in TECH_TERMS order to keep the output stable
+    keywords = [term.lower() for term in TECH_TERMS if term.lower() in found]
 
     return keywords
 
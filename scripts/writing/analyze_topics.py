@@ -46,52 +46,64 @@ TOPIC_PATTERNS = {
     ]
 }
 
+# Lowercased keywords for case-insensitive matching, built once
+TOPIC_KEYWORDS_LOWER = {
+    topic: [keyword.lower() for keyword in keywords]
+    for topic, keywords in TOPIC_PATTERNS.items()
+}
+
 def extract_insights_from_md():
     """Extract insights from markdown file"""
-    with open(INSIGHTS_FILE, 'r', encoding='utf-8') as f:
-        content = f.read()
-
     insights = []
     current_date = None
     current_insight = None
 
-    for line in content.split('\n'):
-        # Match date headers
-        if line.startswith('## 2025-'):
-            current_date = line.split()[1]
-
-        # Match insight headers
-        elif line.startswith('### Insight'):
-            if current_insight and current_insight['content']:
-                insights.append(current_insight)
-            score_match = re.search(r'Score: (\d+)', line)
-            current_insight = {
-                'date': current_date,
-                'score': int(score_match.group(1)) if score_match else 0,
-                'content': ''
-            }
-
-        # Match time
-        elif line.startswith('**Time:**') and current_insight:
-            current_insight['time'] = line.replace('**Time:**', '').strip()
-
-        # Collect content
-        elif current_insight and line and not line.startswith('#') and not line.startswith('---'):
-            current_insight['content'] += line + '\n'
+    # Stream the file line by line instead of reading it into memory whole
+    with open(INSIGHTS_FILE, 'r', encoding='utf-8') as f:
+        for raw_line in f:
+            line = raw_line.rstrip('\n')
+
+            # Match date headers
+            if line.startswith('## 2025-'):
+                current_date = line.split()[1]
+
+            # Match insight headers
+            elif line.startswith('### Insight'):
+                if current_insight and current_insight['content']:
+                    insights.append(current_insight)
+                score_match = re.search(r'Score: (\d+)', line)
+                current_insight = {
+                    'date': current_date,
+                    'score': int(score_match.group(1)) if score_match else 0,
+                    'content': []
+                }
+
+            # Match time
+            elif line.startswith('**Time:**') and current_insight:
+                current_insight['time'] = line.replace('**Time:**', '').strip()
+
+            # Collect content
+            elif current_insight and line and not line.startswith('#') and not line.startswith('---'):
+                current_insight['content'].append(line + '\n')
 
     # Add last insight
     if current_insight and current_insight['content']:
         insights.append(current_insight)
 
+    # Content lines are collected in a list and joined once per insight
+    for insight in insights:
+        insight['content'] = ''.join(insight['content'])
+
     return insights
 
 def categorize_insight(content):
     """Determine which topics an insight belongs to"""
     topics = []
+    content_lower = content.lower()
 
-    for topic, keywords in TOPIC_PATTERNS.items():
+    for topic, keywords in TOPIC_KEYWORDS_LOWER.items():
         for keyword in keywords:
-            if keyword.lower() in content.lower():
+            if keyword in content_lower:
                 topics.append(topic)
                 break  # One match per topic is enough
 
@@ -113,6 +125,9 @@ def analyze_topics():
         for topic in topics:
             topic_insights[topic].append(insight)
 
+    # Topics ordered by insight count, shared by the summary, details and console output
+    ranked_topics = sorted(topic_insights, key=lambda t: len(topic_insights[t]), reverse=True)
+
     # Generate topic analysis report
     with open(OUTPUT_FILE, 'w', encoding='utf-8') as f:
         f.write("# Topic Analysis for Article Writing\n\n")
@@ -124,13 +139,13 @@ def analyze_topics():
         f.write("| Topic | Insights Count |\n")
         f.write("|-------|----------------|\n")
 
-        for topic in sorted(topic_insights.keys(), key=lambda t: len(topic_insights[t]), reverse=True):
+        for topic in ranked_topics:
             f.write(f"| {topic} | {len(topic_insights[topic])} |\n")
 
         f.write("\n---\n\n")
 
         # Detailed insights per topic
-        for topic in sorted(topic_insights.keys(), key=lambda t: len(topic_insights[t]), reverse=True):
+        for topic in ranked_topics:
             insights_list = topic_insights[topic]
             f.write(f"## {topic} ({len(insights_list)} insights)\n\n")
 
@@ -146,7 +161,7 @@ def analyze_topics():
     print(f"Topic analysis complete!")
     print(f"Output saved to: {OUTPUT_FILE}")
     print(f"\nTopic breakdown:")
-    for topic in sorted(topic_insights.keys(), key=lambda t: len(topic_insights[t]), reverse=True):
+    for topic in ranked_topics:
         print(f"  {topic}: {len(topic_insights[topic])} insights")
     print(f"{'='*60}")
 
@@ -18,6 +18,17 @@ import sys
 from pathlib import Path
 
 
+# ---------------------------------------------------------------------------
+# Precompiled patterns
+# ---------------------------------------------------------------------------
+
+MARKDOWN_LINK_PATTERN = re.compile(r'\[([^\]]+)\]\(([^)]+)\)')
+FRONTMATTER_PATTERN = re.compile(r'^---\n.*?\n---\n', re.DOTALL)
+# Opening and closing <section>/<span> tags that leak in from WeChat HTML
+WECHAT_WRAPPER_TAG_PATTERN = re.compile(r'</?(?:section|span)[^>]*>')
+EXTRA_BLANK_LINES_PATTERN = re.compile(r'\n{3,}')
+
+
 # ---------------------------------------------------------------------------
 # Shared helpers
 # ---------------------------------------------------------------------------
@@ -57,7 +68,7 @@ def extract_links(content: str) -> tuple[str, list[tuple[str, str]]]:
             links.append((text, url))
         return text  # replace [text](url) with just text
 
-    cleaned = re.sub(r'\[([^\]]+)\]\(([^)]+)\)', replacer, content)
+    cleaned = MARKDOWN_LINK_PATTERN.sub(replacer, content)
     return cleaned, links
 
 
@@ -141,16 +152,13 @@ def cmd_zhihu(article_path: Path):
     print(f"Formatting {md_file.name} for Zhihu...")
 
     # Strip YAML frontmatter
-    content = re.sub(r'^---\n.*?\n---\n', '', content, flags=re.DOTALL)
+    content = FRONTMATTER_PATTERN.sub('', content)
 
     # Remove WeChat-specific HTML tags if any leaked in
-    content = re.sub(r'<section[^>]*>', '', content)
-    content = re.sub(r'</section>', '', content)
-    content = re.sub(r'<span[^>]*>', '', content)
-    content = re.sub(r'</span>', '', content)
+    content = WECHAT_WRAPPER_TAG_PATTERN.sub('', content)
 
     # Normalise multiple blank lines → max 2
-    content = re.sub(r'\n{3,}', '\n\n', content)
+    content = EXTRA_BLANK_LINES_PATTERN.sub('\n\n', content)
 
     # Add Zhihu discussion footer
     content = content.rstrip() + "\n\n---\n*欢迎在评论区分享你的看法。*\n"
@@ -12,6 +12,32 @@ from pathlib import Path
 DAILY_DIR = Path("/Users/Shared/code/benyu/daily_messages")
 OUTPUT_FILE = Path("/Users/Shared/code/benyu/article_insights.md")
 
+# Indicators of article-worthy content
+ARTICLE_INDICATORS = (
+    ('我认为', 3), ('我觉得', 2), ('我的经验', 4), ('我发现', 3),
+    ('问题在于', 3), ('关键是', 3), ('本质上', 4),
+    ('这说明', 2), ('这意味着', 3), ('这反映', 3),
+    ('应该', 2), ('不应该', 2), ('必须', 2),
+    ('错误', 2), ('正确', 2), ('误区', 3),
+    ('原因', 2), ('为什么', 2), ('怎么', 1),
+    ('软件', 1), ('代码', 1), ('系统', 1), ('架构', 2),
+    ('产品', 1), ('设计', 1), ('工程', 2),
+    ('流程', 2), ('方法', 2), ('模式', 2),
+)
+
+# Technical terms boost (stored lowercased for case-insensitive matching)
+TECH_TERMS = tuple(term.lower() for term in (
+    'AI', 'LLM', 'API', 'GPT', 'Claude', 'token', 'FDE', 'Palantir',
+    'kubernetes', 'Docker', 'pipeline', 'frontend', 'backend', 'database',
+))
+
+# Negative indicators (casual chat)
+CASUAL_PATTERNS = (
+    ('[', 1),  # Emoji patterns like [捂脸]
+    ('哈哈', 2), ('😂', 2), ('👍', 2),
+    ('不错', 1), ('好的', 1), ('谢谢', 1),
+)
+
 def is_article_worthy(message):
     """
     Determine if a message contains article-worthy content
@@ -24,29 +50,14 @@ def is_article_worthy(message):
 
     score = 0
 
-    # Indicators of article-worthy content
-    article_indicators = [
-        ('我认为', 3), ('我觉得', 2), ('我的经验', 4), ('我发现', 3),
-        ('问题在于', 3), ('关键是', 3), ('本质上', 4),
-        ('这说明', 2), ('这意味着', 3), ('这反映', 3),
-        ('应该', 2), ('不应该', 2), ('必须', 2),
-        ('错误', 2), ('正确', 2), ('误区', 3),
-        ('原因', 2), ('为什么', 2), ('怎么', 1),
-        ('软件', 1), ('代码', 1), ('系统', 1), ('架构', 2),
-        ('产品', 1), ('设计', 1), ('工程', 2),
-        ('流程', 2), ('方法', 2), ('模式', 2),
-    ]
-
-    for indicator, weight in article_indicators:
+    for indicator, weight in ARTICLE_INDICATORS:
         if indicator in content:
             score += weight
 
     # Technical terms boost
-    tech_terms = ['AI', 'LLM', 'API', 'GPT', 'Claude', 'token', 'FDE', 'Palantir',
-                   'kubernetes', 'Docker', 'pipeline', 'frontend', 'backend', 'database']
-
-    for term in tech_terms:
-        if term.lower() in content.lower():
+    content_lower = content.lower()
+    for term in TECH_TERMS:
+        if term in content_lower:
             score += 1
 
     # Long messages tend to be more substantial
@@ -56,13 +67,7 @@ def is_article_worthy(message):
         score += 2
 
     # Negative indicators (casual chat)
-    casual_patterns = [
-        ('[', 1),  # Emoji patterns like [捂脸]
-        ('哈哈', 2), ('😂', 2), ('👍', 2),
-        ('不错', 1), ('好的', 1), ('谢谢', 1),
-    ]
-
-    for pattern, penalty in casual_patterns:
+    for pattern, penalty in CASUAL_PATTERNS:
         if pattern in content:
             score -= penalty
 
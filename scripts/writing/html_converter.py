@@ -15,6 +15,26 @@ from PIL import Image
 import io
 
 
+# Inline style templates per tag; {font_family} is filled from the CSS file
+STYLE_TEMPLATES = {
+    'p': "text-align: left; line-height: 1.75; font-family: {font_family}; font-size: 16px; margin: 1.5em 8px; letter-spacing: 0.1em; color: rgb(63, 63, 63);",
+    'h1': "text-align: center; line-height: 1.75; font-size: 24px; display: table; padding: 0.2em 0.5em; margin: 2em auto 1em; color: rgb(255, 255, 255); background: rgb(15, 76, 129); font-weight: bold;",
+    'h2': "text-align: left; line-height: 1.75; font-size: 18px; margin: 2em 8px 1em; color: rgb(15, 76, 129); font-weight: bold; border-bottom: 2px solid rgb(15, 76, 129); padding-bottom: 0.3em;",
+    'h3': "text-align: left; line-height: 1.75; font-size: 16px; margin: 1.5em 8px 0.8em; color: rgb(15, 76, 129); font-weight: bold;",
+    'blockquote': "padding: 1em; border-left: 4px solid rgb(15, 76, 129); border-radius: 6px; color: rgba(0, 0, 0, 0.5); background: rgb(247, 247, 247); margin-bottom: 1em; margin-top: 0px;",
+    'code': "font-size: 90%; color: rgb(221, 17, 68); background: rgba(27, 31, 35, 0.05); padding: 3px 5px; border-radius: 4px;",
+    'ul': "list-style: circle; padding-left: 1em; margin-left: 0px; color: rgb(63, 63, 63); line-height: 1.75; font-family: {font_family}; font-size: 16px;",
+    'ol': "padding-left: 1em; margin-left: 0px; color: rgb(63, 63, 63); line-height: 1.75; font-family: {font_family}; font-size: 16px;",
+    'li': "display: block; margin: 0.2em 8px;",
+    'strong': "color: rgb(15, 76, 129); font-weight: bold;",
+    'a': "color: rgb(15, 76, 129); text-decoration: none;",
+    'img': "max-width: 100%; height: auto; display: block; margin: 1em auto;",
+}
+
+# Qualities tried one by one (85, 80, 75) before compress_image binary-searches
+LINEAR_QUALITY_PROBES = 3
+
+
 def inline_styles_to_html(html_content: str, css_styles: Dict[str, str]) -> str:
     """Apply inline styles to HTML elements based on CSS rules."""
 
@@ -22,29 +42,19 @@ def inline_styles_to_html(html_content: str, css_styles: Dict[str, str]) -> str:
 
     # Map CSS selectors to inline styles
     style_mapping = {
-        'p': f"text-align: left; line-height: 1.75; font-family: {css_styles['font_family']}; font-size: 16px; margin: 1.5em 8px; letter-spacing: 0.1em; color: rgb(63, 63, 63);",
-        'h1': "text-align: center; line-height: 1.75; font-size: 24px; display: table; padding: 0.2em 0.5em; margin: 2em auto 1em; color: rgb(255, 255, 255); background: rgb(15, 76, 129); font-weight: bold;",
-        'h2': "text-align: left; line-height: 1.75; font-size: 18px; margin: 2em 8px 1em; color: rgb(15, 76, 129); font-weight: bold; border-bottom: 2px solid rgb(15, 76, 129); padding-bottom: 0.3em;",
-        'h3': "text-align: left; line-height: 1.75; font-size: 16px; margin: 1.5em 8px 0.8em; color: rgb(15, 76, 129); font-weight: bold;",
-        'blockquote': "padding: 1em; border-left: 4px solid rgb(15, 76, 129); border-radius: 6px; color: rgba(0, 0, 0, 0.5); background: rgb(247, 247, 247); margin-bottom: 1em; margin-top: 0px;",
-        'code': "font-size: 90%; color: rgb(221, 17, 68); background: rgba(27, 31, 35, 0.05); padding: 3px 5px; border-radius: 4px;",
-        'ul': f"list-style: circle; padding-left: 1em; margin-left: 0px; color: rgb(63, 63, 63); line-height: 1.75; font-family: {css_styles['font_family']}; font-size: 16px;",
-        'ol': f"padding-left: 1em; margin-left: 0px; color: rgb(63, 63, 63); line-height: 1.75; font-family: {css_styles['font_family']}; font-size: 16px;",
-        'li': "display: block; margin: 0.2em 8px;",
-        'strong': "color: rgb(15, 76, 129); font-weight: bold;",
-        'a': "color: rgb(15, 76, 129); text-decoration: none;",
-        'img': "max-width: 100%; height: auto; display: block; margin: 1em auto;",
+        tag: template.format(font_family=css_styles['font_family'])
+        for tag, template in STYLE_TEMPLATES.items()
     }
 
-    # Apply styles to each element type
-    for tag, style in style_mapping.items():
-        for element in soup.find_all(tag):
-            # Preserve existing styles if any
-            existing_style = element.get('style', '')
-            if existing_style:
-                element['style'] = f"{existing_style}; {style}"
-            else:
-                element['style'] = style
+    # Apply styles to every mapped element in a single tree traversal
+    for element in soup.find_all(list(style_mapping)):
+        style = style_mapping[element.name]
+        # Preserve existing styles if any
+        existing_style = element.get('style', '')
+        if existing_style:
+            element['style'] = f"{existing_style}; {style}"
+        else:
+            element['style'] = style
 
     # Special handling for strong tags in blockquotes
     for blockquote in soup.find_all('blockquote'):
@@ -66,24 +76,40 @@ def compress_image(image_path: Path, max_size_kb: int = 500) -> bytes:
         elif img.mode != 'RGB':
             img = img.convert('RGB')
 
-        # Start with quality 85
-        quality = 85
-        output = io.BytesIO()
-
-        while quality > 20:
-            output.seek(0)
-            output.truncate()
-            img.save(output, format='JPEG', quality=quality, optimize=True)
-
-            size_kb = len(output.getvalue()) / 1024
-
-            if size_kb <= max_size_kb:
-                break
-
-            # Reduce quality by 5 each iteration
-            quality -= 5
+        # Candidate qualities from 85 down to 25 in steps of 5
+        qualities = range(85, 20, -5)
+        encoded = {}
+
+        def encode(index: int) -> bytes:
+            if index not in encoded:
+                output = io.BytesIO()
+                img.save(output, format='JPEG', quality=qualities[index], optimize=True)
+                encoded[index] = output.getvalue()
+            return encoded[index]
+
+        def fits(index: int) -> bool:
+            return len(encode(index)) / 1024 <= max_size_kb
+
+        # Most images fit at or just below the highest quality, so step
+        # through the top few qualities exactly like the original loop
+        for index in range(LINEAR_QUALITY_PROBES):
+            if fits(index):
+                return encode(index)
+
+        # JPEG size grows with quality, so binary-search the remaining range
+        # for the highest quality that fits instead of re-encoding every step
+        lo, hi = LINEAR_QUALITY_PROBES, len(qualities) - 1
+        best = None
+        while lo <= hi:
+            mid = (lo + hi) // 2
+            if fits(mid):
+                best = mid
+                hi = mid - 1
+            else:
+                lo = mid + 1
 
-        return output.getvalue()
+        # Nothing fits: fall back to the lowest quality, as before
+        return encode(best if best is not None else len(qualities) - 1)
 
 
 def image_to_base64(image_bytes: bytes) -> str:
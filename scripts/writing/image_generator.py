@@ -15,17 +15,24 @@ import sys
 import re
 import json
 import base64
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from io import BytesIO
+from typing import TYPE_CHECKING
 
-from google import genai
-from google.genai import types
 from PIL import Image, ImageDraw, ImageFont
 
+if TYPE_CHECKING:
+    from google import genai
+
 
 GOOGLE_AI_KEY_PATH = Path.home() / ".credentials" / "google.ai.txt"
 CREDENTIALS_PATH = Path.home() / ".credentials"
 
+# Maximum number of concurrent Imagen requests
+MAX_IMAGEN_WORKERS = 4
+
 
 def load_api_key() -> str:
     key = os.environ.get("GOOGLE_AI_API_KEY")
@@ -120,6 +127,16 @@ def build_prompts(meta: dict, persona: str = "") -> list[dict]:
     return prompts
 
 
+@lru_cache(maxsize=8)
+def load_watermark_font(font_size: int) -> ImageFont.FreeTypeFont | ImageFont.ImageFont:
+    """Load the watermark font once per size; all images in a run share it."""
+    try:
+        # Try system font first
+        return ImageFont.truetype("/System/Library/Fonts/PingFang.ttc", font_size)
+    except Exception:
+        return ImageFont.load_default()
+
+
 def add_watermark(img: Image.Image) -> Image.Image:
     """Add visible 'AI生成' badge to bottom-right corner."""
     img = img.copy()
@@ -129,11 +146,7 @@ def add_watermark(img: Image.Image) -> Image.Image:
     label = "AI生成"
     font_size = max(24, h // 25)
 
-    try:
-        # Try system font first
-        font = ImageFont.truetype("/System/Library/Fonts/PingFang.ttc", font_size)
-    except Exception:
-        font = ImageFont.load_default()
+    font = load_watermark_font(font_size)
 
     bbox = draw.textbbox((0, 0), label, font=font)
     text_w = bbox[2] - bbox[0]
@@ -155,8 +168,10 @@ def add_watermark(img: Image.Image) -> Image.Image:
     return img
 
 
-def generate_image(client: genai.Client, prompt_info: dict) -> Image.Image | None:
+def generate_image(client: "genai.Client", prompt_info: dict) -> Image.Image | None:
     """Call Imagen 4 and return PIL Image."""
+    from google.genai import types
+
     try:
         response = client.models.generate_images(
             model="imagen-4.0-generate-001",
@@ -202,12 +217,22 @@ def main():
     print(f"\nGenerating {len(prompts)} images...")
 
     api_key = load_api_key()
+
+    # Import the SDK only once we actually call Imagen; it is slow to load
+    from google import genai
+
     client = genai.Client(api_key=api_key)
 
+    # Imagen calls are independent network round-trips, so issue them concurrently
+    with ThreadPoolExecutor(max_workers=MAX_IMAGEN_WORKERS) as pool:
+        futures = []
+        for p in prompts:
+            print(f"  → {p['name']} ({p['aspect_ratio']})...")
+            futures.append(pool.submit(generate_image, client, p))
+        images = [future.result() for future in futures]
+
     generated = []
-    for p in prompts:
-        print(f"  → {p['name']} ({p['aspect_ratio']})...")
-        img = generate_image(client, p)
+    for p, img in zip(prompts, images):
         if img is None:
             continue
 
@@ -17,6 +17,9 @@ from pathlib import Path
 from typing import List, Dict, Optional, Tuple
 import hashlib
 
+# Read size used when hashing image files
+HASH_CHUNK_SIZE = 64 * 1024
+
 
 def ensure_images_dir(article_path: str) -> Path:
     """
@@ -272,8 +275,12 @@ def get_image_metadata(image_path: str) -> Dict[str, any]:
     stat = img_file.stat()
 
     # Calculate file hash for deduplication
+    # Stream in chunks so large images are never held in memory in full
+    hasher = hashlib.sha256()
     with open(img_file, 'rb') as f:
-        file_hash = hashlib.sha256(f.read()).hexdigest()
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b''):
+            hasher.update(chunk)
+    file_hash = hasher.hexdigest()
 
     metadata = {
         'filename': img_file.name,
@@ -26,6 +26,16 @@ from datetime import date
 # Chat data location
 CHAT_BASE = '/Users/Shared/code/aichat/chats'
 
+# Media message types rendered as a placeholder instead of their content
+MEDIA_PLACEHOLDERS = {
+    3: '[图片]',   # Image
+    43: '[视频]',  # Video
+    34: '[语音]',  # Voice
+}
+
+# Message types dropped entirely
+SKIPPED_MESSAGE_TYPES = frozenset({47})  # Sticker
+
 def load_messages(chatroom_dir: str, target_date: str) -> list:
     """Load messages from JSON file."""
     path = os.path.join(CHAT_BASE, chatroom_dir, f'{target_date}.json')
@@ -47,14 +57,11 @@ def format_message(msg: dict) -> str:
         sender = msg.get('senderName', 'unknown')
 
     # Handle different message types
-    if msg_type == 3:  # Image
-        return f'{sender}: [图片]'
-    elif msg_type == 43:  # Video
-        return f'{sender}: [视频]'
-    elif msg_type == 34:  # Voice
-        return f'{sender}: [语音]'
-    elif msg_type == 47:  # Sticker
-        return None  # Skip stickers
+    if msg_type in SKIPPED_MESSAGE_TYPES:
+        return None
+    placeholder = MEDIA_PLACEHOLDERS.get(msg_type)
+    if placeholder:
+        return f'{sender}: {placeholder}'
 
     content = msg.get('content', '')
     if not content: